@@ -4,17 +4,54 @@ Character module for the RPG game.
 This module contains the Character base class and the Boss subclass.
 """
 import sys
-import os
 import random
-from typing import Optional, Union, Tuple
-
-# Add the project directory to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from typing import Callable, List, Optional, Tuple
 
 from rpg_game.weapon import Weapon
 from rpg_game.game_logger import GameLogger
 from rpg_game.inventory import Inventory, Item, Potion, Key
 
+# Default source of random rolls for every character
+_rand = random.random
+# Chance that a boss's attack deals bonus damage of half its base damage
+BOSS_BONUS_CHANCE = 0.2
+
+# Display pieces built once at import instead of on every render
+_SEP = "=" * 40
+# One heart per 10 health, covering health values up to 500
+_HEART_BARS = tuple("❤️" * hearts for hearts in range(51))
+# Inventory icon for each item type, any other item uses a scroll
+_ITEM_ICONS = {Potion: "🧪", Key: "🔑"}
+
+
+def resolve_damage(
+    base_damage: int,
+    damage_bonus: int,
+    crit_multiplier: float,
+    roll: float,
+    crit_chance: float
+) -> Tuple[int, bool]:
+    """
+    Work out the damage of a single attack.
+
+    This is kept free of any objects so the combat maths can be reused and tested on its own.
+
+    Args:
+        base_damage: The attacker's base damage
+        damage_bonus: The bonus damage from the attacker's weapon
+        crit_multiplier: The damage multiplier for critical hits
+        roll: A random roll between 0.0 and 1.0
+        crit_chance: The chance to land a critical hit (0.0 to 1.0)
+
+    Returns:
+        Tuple containing (total_damage, was_critical)
+    """
+    total_damage = base_damage + damage_bonus
+    is_critical = roll < crit_chance
+    if is_critical:
+        total_damage = int(total_damage * crit_multiplier)
+    return total_damage, is_critical
+
 
 class Character:
     """
@@ -22,6 +59,17 @@ class Character:
     
     This class demonstrates encapsulation with private attributes and getter/setter methods.
     """
+    # Fixed attribute slots instead of a per-instance __dict__ keep characters small
+    # and make attribute access faster
+    __slots__ = (
+        '_name', '_health', '_damage', '_weapon', '_inventory',
+        '_crit_chance', '_crit_multiplier', '_rng_source'
+    )
+    
+    # Display banners never change, so they are built once when the class is created
+    _HEADER = "\n" + _SEP + "\n"
+    _INV_HEADER = "\n" + _SEP + "\n" + "INVENTORY".center(40) + "\n" + _SEP + "\n"
+    _INV_FOOTER = "\n" + _SEP + "\n"
     
     def __init__(
         self, 
@@ -50,6 +98,8 @@ class Character:
         self._inventory = Inventory()  # Each character has their own inventory
         self._crit_chance = min(max(crit_chance, 0.0), 1.0)  # Ensure between 0 and 1
         self._crit_multiplier = max(crit_multiplier, 1.0)  # Ensure at least 1.0
+        # Where critical hit and bonus rolls come from (see set_rng_source)
+        self._rng_source: Callable[[], float] = _rand
         # The underscore prefix (_) indicates that this attribute is intended to be "private"
         # - meaning it should only be accessed through the getter and setter methods.
         # This is a convention in Python, not a strict rule enforced by the language.
@@ -73,6 +123,23 @@ class Character:
         else:
             self._health = new_health
 
+    def heal(self, amount: int, cap: int = 100) -> int:
+        """
+        Restore health without going over a maximum.
+        Args:   amount: The amount of health to restore
+                cap: The highest health the character can be healed to
+        Returns:    The character's new health
+        """
+        self._health = min(self._health + amount, cap)
+        return self._health
+
+    def set_rng_source(self, source: Callable[[], float]) -> None:
+        """
+        Set where the character's random rolls come from, e.g. a seeded random.Random().random.
+        Args:   source: A function returning a random number between 0.0 and 1.0
+        """
+        self._rng_source = source
+
     # Method for the character to attack an enemy
     def attack(self, enemy: 'Character', logger: Optional[GameLogger] = None) -> Tuple[int, bool]:
         """
@@ -85,22 +152,18 @@ class Character:
         Returns:
             Tuple containing (total_damage_dealt, was_critical)
         """
-        import random
-        
-        # Calculate base damage
-        base_damage = self._damage + self._weapon.get_damage_bonus()
-        
-        # Check for critical hit
-        is_critical = random.random() < self._crit_chance
+        # Calculate damage, applying the critical multiplier if the roll is a critical hit
+        total_damage, is_critical = resolve_damage(
+            self._damage,
+            self._weapon._damage_bonus,
+            self._crit_multiplier,
+            self._rng_source(),
+            self._crit_chance
+        )
         
-        # Apply critical multiplier if critical hit
-        if is_critical:
-            total_damage = int(base_damage * self._crit_multiplier)
-        else:
-            total_damage = base_damage
-            
-        # Apply damage to enemy
-        enemy.set_health(enemy.get_health() - total_damage)
+        # Apply damage to enemy, reading health directly as this is the busiest combat path
+        new_health = enemy._health - total_damage
+        enemy._health = new_health if new_health > 0 else 0
         
         # Log the attack if logger is provided
         if logger:
@@ -108,6 +171,31 @@ class Character:
             
         return total_damage, is_critical
 
+    @classmethod
+    def batch_attack(
+        cls,
+        attackers: List['Character'],
+        defenders: List['Character'],
+        logger: Optional[GameLogger] = None
+    ) -> List[Tuple[int, bool]]:
+        """
+        Resolve a whole round of attacks in one call.
+        
+        Each attacker hits the defender at the same position in the defenders list.
+        
+        Args:
+            attackers: The characters attacking this round
+            defenders: The characters being attacked, matched to attackers by position
+            logger: Optional logger to log the combat
+            
+        Returns:
+            List of (total_damage_dealt, was_critical) tuples, one per attacker
+        """
+        if len(attackers) != len(defenders):
+            raise ValueError("Each attacker needs exactly one defender")
+        # Each attacker still uses its own attack method, so bosses keep their bonus damage
+        return [attacker.attack(defender, logger) for attacker, defender in zip(attackers, defenders)]
+
     # Inventory methods
     def add_item(self, item: Item) -> bool:
         """
@@ -132,12 +220,7 @@ class Character:
         Returns:    A message describing the item's effect
         """
         # Find the item in the inventory
-        item = None
-        for inv_item in self._inventory.items:
-            if inv_item.get_name().lower() == item_name.lower():
-                item = inv_item
-                break
-                
+        item = self._inventory.get_item(item_name)
         if not item:
             return f"You don't have a {item_name} in your inventory."
             
@@ -146,37 +229,39 @@ class Character:
         
         # If it's a potion, remove it after use
         if isinstance(item, Potion):
-            self._inventory.items.remove(item)
+            self._inventory.remove_item(item_name)
             
         return result
 
+    def get_inventory_items(self) -> Tuple[Item, ...]:
+        """
+        Get the items in the character's inventory.
+        Returns:    A read-only snapshot of the items, in the order they were added
+        """
+        return tuple(self._inventory.items)
+
     def display_inventory(self) -> None:
         """
         Display the contents of the character's inventory with detailed information.
         """
-        print("\n" + "=" * 40)
-        print("INVENTORY".center(40))
-        print("=" * 40)
-        
-        # Display gold
-        print(f"\n💰 GOLD: {self._inventory.gold}")
+        parts = [self._INV_HEADER, f"\n💰 GOLD: {self._inventory.gold}\n", "\n📦 ITEMS:\n"]
         
         # Display items
-        print("\n📦 ITEMS:")
         items = self._inventory.items
         if not items:
-            print("  Your inventory is empty.")
+            parts.append("  Your inventory is empty.\n")
         else:
             for i, item in enumerate(items, 1):
-                item_type = "🧪" if isinstance(item, Potion) else "🔑" if isinstance(item, Key) else "📜"
-                print(f"  {i}. {item_type} {item.get_name()}: {item.get_description()}")
+                item_type = _ITEM_ICONS.get(type(item), "📜")
+                parts.append(f"  {i}. {item_type} {item.get_name()}: {item.get_description()}\n")
                 
                 # Show additional info for potions
-                if isinstance(item, Potion):
-                    print(f"     Heals: {item.get_heal_amount()} HP")
+                if type(item) is Potion:
+                    parts.append(f"     Heals: {item.get_heal_amount()} HP\n")
                 # Add more item type specific info here if needed
         
-        print("\n" + "=" * 40)
+        parts.append(self._INV_FOOTER)
+        sys.stdout.write("".join(parts))
 
     def add_gold(self, amount: int) -> None:
         """
@@ -193,6 +278,15 @@ class Character:
         """
         return self._inventory.remove_gold(amount)
 
+    def get_combat_stats(self) -> Tuple[int, int, float, float, float, int]:
+        """
+        Get the numbers that decide a fight, for use in combat simulations.
+        Returns:    Tuple of (health, damage_per_hit, crit_chance, crit_multiplier,
+                    bonus_chance, bonus_damage); characters have no bonus attack
+        """
+        damage_per_hit = self._damage + self._weapon.get_damage_bonus()
+        return self._health, damage_per_hit, self._crit_chance, self._crit_multiplier, 0.0, 0
+
     # Getter for name
     def get_name(self) -> str:
         """Get the character's name."""
@@ -206,28 +300,40 @@ class Character:
     # Method to display character information
     def display(self) -> None:
         """Display the character's information with ASCII art and dynamic effects."""
+        # Write everything at once rather than printing line by line
+        sys.stdout.write(self.render_stats())
+
+    def render_stats(self) -> str:
+        """
+        Build the character's information display without printing it.
+        Returns:    The text shown by display(), so callers can combine it with other output
+        """
         weapon_name = self._weapon.get_name() if self._weapon else 'No Weapon'
         weapon_damage = self._weapon.get_damage_bonus() if self._weapon else 0
-        health_bar = "❤️" * (self.get_health() // 10)  # Simple health bar
-        damage_indicator = "⚔️" if self.get_damage() > 0 else ""
+        health = self._health
+        health_bar = _HEART_BARS[min(health // 10, len(_HEART_BARS) - 1)]  # Simple health bar
+        damage_indicator = "⚔️" if self._damage > 0 else ""
         
-        print(f"\n{'=' * 40}")
-        print(f"{self.get_name()} {damage_indicator}")
-        print(f"Health: {self.get_health()} {health_bar}")
-        print(f"Damage: {self.get_damage()}")
-        print(f"Weapon: {weapon_name} (+{weapon_damage} Damage)")
-        print(f"{'=' * 40}")
+        lines = [
+            f"{self._name} {damage_indicator}",
+            f"Health: {health} {health_bar}",
+            f"Damage: {self._damage}",
+            f"Weapon: {weapon_name} (+{weapon_damage} Damage)",
+            _SEP
+        ]
         
         # Add some dynamic effects
-        if self.get_health() < 30:
-            print("⚠️  WARNING: Low health! ⚠️")
-        elif self.get_health() < 60:
-            print("⚠️  Caution: Health is dropping ⚠️")
+        if health < 30:
+            lines.append("⚠️  WARNING: Low health! ⚠️")
+        elif health < 60:
+            lines.append("⚠️  Caution: Health is dropping ⚠️")
         
         # Show weapon effects if equipped
         if self._weapon:
-            print(f"\nWeapon Effects:")
-            print(f"- {weapon_name} boosts damage by {weapon_damage}")
+            lines.append("\nWeapon Effects:")
+            lines.append(f"- {weapon_name} boosts damage by {weapon_damage}")
+        
+        return self._HEADER + "\n".join(lines) + "\n"
 
 
 class Boss(Character):
@@ -236,6 +342,9 @@ class Boss(Character):
     
     This class demonstrates inheritance and method overriding.
     """
+    # Bosses add no attributes of their own; an empty __slots__ stops a __dict__ being added back
+    __slots__ = ()
+    
     def __init__(self, name: str, health: int, damage: int) -> None:
         """
         Initialize a new Boss with enhanced combat abilities.
@@ -274,7 +383,7 @@ class Boss(Character):
         damage, is_critical = super().attack(enemy, logger)
         
         # Boss gets a small chance to deal bonus damage
-        if random.random() < 0.2:  # 20% chance for bonus damage
+        if self._rng_source() < BOSS_BONUS_CHANCE:
             bonus_damage = self._damage // 2
             enemy.set_health(enemy.get_health() - bonus_damage)
             if logger:
@@ -282,4 +391,13 @@ class Boss(Character):
                 logger.log_combat(self, enemy, damage + bonus_damage, is_critical=is_critical)
             return damage + bonus_damage, is_critical
             
-        return damage, is_critical
\ No newline at end of file
+        return damage, is_critical
+
+    def get_combat_stats(self) -> Tuple[int, int, float, float, float, int]:
+        """
+        Get the numbers that decide a fight, including the boss's bonus attack.
+        Returns:    Tuple of (health, damage_per_hit, crit_chance, crit_multiplier,
+                    bonus_chance, bonus_damage)
+        """
+        stats = super().get_combat_stats()
+        return stats[:4] + (BOSS_BONUS_CHANCE, self._damage // 2)
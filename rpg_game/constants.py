@@ -3,40 +3,41 @@ Constants for the RPG game.
 
 This module contains all the constant values used throughout the game.
 """
+from typing import Final, Tuple
 
 # Player constants
-PLAYER_INITIAL_HEALTH = 110
-PLAYER_INITIAL_DAMAGE = 10
+PLAYER_INITIAL_HEALTH: Final = 110
+PLAYER_INITIAL_DAMAGE: Final = 10
 
 # Boss constants
-GOBLIN_KING_NAME = "Goblin King"
-GOBLIN_KING_HEALTH = 50
-GOBLIN_KING_DAMAGE = 8
+GOBLIN_KING_NAME: Final = "Goblin King"
+GOBLIN_KING_HEALTH: Final = 50
+GOBLIN_KING_DAMAGE: Final = 8
 
-DARK_SORCERER_NAME = "Dark Sorcerer"
-DARK_SORCERER_HEALTH = 60
-DARK_SORCERER_DAMAGE = 9
+DARK_SORCERER_NAME: Final = "Dark Sorcerer"
+DARK_SORCERER_HEALTH: Final = 60
+DARK_SORCERER_DAMAGE: Final = 9
 
 # Weapon constants
-WEAPON_ROCK_NAME = "Rock"
-WEAPON_ROCK_DAMAGE = 2
+WEAPON_ROCK_NAME: Final = "Rock"
+WEAPON_ROCK_DAMAGE: Final = 2
 
-WEAPON_PAPER_NAME = "Paper"
-WEAPON_PAPER_DAMAGE = 3
+WEAPON_PAPER_NAME: Final = "Paper"
+WEAPON_PAPER_DAMAGE: Final = 3
 
-WEAPON_SCISSORS_NAME = "Scissors"
-WEAPON_SCISSORS_DAMAGE = 4
+WEAPON_SCISSORS_NAME: Final = "Scissors"
+WEAPON_SCISSORS_DAMAGE: Final = 4
 
 # UI constants
-SEPARATOR_LENGTH = 30
-BORDER_LENGTH = 80
+SEPARATOR_LENGTH: Final = 30
+BORDER_LENGTH: Final = 80
 
 # Game messages
-WELCOME_MESSAGE = (
+WELCOME_MESSAGE: Final = (
     "🌟 Welcome, brave adventurer, to the RPG Adventure! 🌟\n"
     "Legends tell of heroes who rise against impossible odds—will you become one?"
 )
-INTRO_MESSAGE = (
+INTRO_MESSAGE: Final = (
     "🌟 IN A REALM SHROUDED IN DARKNESS AND PERIL... 🌟\n"
     "You, {player_name}, have been chosen by fate to restore balance to this troubled land.\n"
     "Two formidable foes stand in your way:\n"
@@ -47,7 +48,7 @@ INTRO_MESSAGE = (
 )
 
 # Level messages
-GOBLIN_KING_INTRO = (
+GOBLIN_KING_INTRO: Final = (
     "🗡️ LEVEL 1: THE GOBLIN KING'S LAIR 🗡️\n"
     "You step into a dank, torch-lit cavern echoing with guttural laughter...\n"
     "The Goblin King, infamous for his brute strength and savage cunning, awaits!\n"
@@ -55,7 +56,7 @@ GOBLIN_KING_INTRO = (
     "Steel yourself, {player_name}, for this battle will be fierce and unforgiving!\n"
     "The fate of the realm depends on your courage and skill!"
 )
-DARK_SORCERER_INTRO = (
+DARK_SORCERER_INTRO: Final = (
     "🔮 LEVEL 2: THE DARK SORCERER'S TOWER 🔮\n"
     "With the Goblin King fallen, you ascend a spiraling staircase into a chamber pulsing with arcane energy...\n"
     "The Dark Sorcerer, master of forbidden spells and illusions, greets you with a sinister grin.\n"
@@ -65,27 +66,74 @@ DARK_SORCERER_INTRO = (
 )
 
 # Combat messages
-VICTORY_MESSAGE = (
+VICTORY_MESSAGE: Final = (
     "🏆 VICTORY! 🏆\n"
     "With a final, decisive blow, you have vanquished {enemy_name}!\n"
     "The air crackles with your newfound power as the path ahead becomes clear.\n"
     "You've proven your strength and courage! What will you do next?"
 )
-DEFEAT_MESSAGE = (
+DEFEAT_MESSAGE: Final = (
     "💀 DEFEAT... 💀\n"
     "You fought valiantly, but {enemy_name} has bested you in battle!\n"
     "Every setback is a lesson—rise again, stronger than before!\n"
     "Remember this defeat and use it to grow stronger for your next battle!"
 )
-GAME_WIN_MESSAGE = (
+GAME_WIN_MESSAGE: Final = (
     "🎉 HEROIC VICTORY! 🎉\n"
     "All evil has been banished thanks to your bravery, {player_name}!\n"
     "The people rejoice, and songs will be sung of your deeds for generations to come!\n"
     "You are a true legend of the realm! What adventures await you next?"
 )
-GAME_OVER_MESSAGE = (
+GAME_OVER_MESSAGE: Final = (
     "☠️ GAME OVER ☠️\n"
     "Though darkness prevails this day, the spirit of a true hero never fades!\n"
     "Rest and return, {player_name}—the world still needs you!\n"
     "Your next adventure awaits, with lessons learned and strength gained!"
 )
+
+# Messages with a single name in them are split around that name once here instead of
+# having str.format parse them on every call
+_INTRO_PARTS: Final = tuple(INTRO_MESSAGE.split("{player_name}"))
+_VICTORY_PARTS: Final = tuple(VICTORY_MESSAGE.split("{enemy_name}"))
+_DEFEAT_PARTS: Final = tuple(DEFEAT_MESSAGE.split("{enemy_name}"))
+_GAME_WIN_PARTS: Final = tuple(GAME_WIN_MESSAGE.split("{player_name}"))
+_GAME_OVER_PARTS: Final = tuple(GAME_OVER_MESSAGE.split("{player_name}"))
+
+
+def _fill(parts: Tuple[str, ...], name: str) -> str:
+    """
+    Put a name back into a message that was split around it.
+
+    Args:
+        parts: The message split around its name placeholder
+        name: The name to fill in
+
+    Returns:
+        The message with the name filled in
+    """
+    return name.join(parts)
+
+
+def render_intro(player_name: str) -> str:
+    """Build the opening message for the player."""
+    return _fill(_INTRO_PARTS, player_name)
+
+
+def render_victory(enemy_name: str) -> str:
+    """Build the victory message for a defeated enemy."""
+    return _fill(_VICTORY_PARTS, enemy_name)
+
+
+def render_defeat(enemy_name: str) -> str:
+    """Build the defeat message for the enemy that won."""
+    return _fill(_DEFEAT_PARTS, enemy_name)
+
+
+def render_game_win(player_name: str) -> str:
+    """Build the message shown when the player has defeated every boss."""
+    return _fill(_GAME_WIN_PARTS, player_name)
+
+
+def render_game_over(player_name: str) -> str:
+    """Build the message shown when the player has been defeated."""
+    return _fill(_GAME_OVER_PARTS, player_name)
@@ -4,16 +4,14 @@ Game module for the RPG game.
 This module contains the Game class that manages the game flow.
 """
 import sys
-import os
-from typing import List, Tuple, Optional
-
-# Add the project directory to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from rpg_game.character import Character, Boss
 from rpg_game.game_logger import GameLogger
-from rpg_game.utils.console import clear_screen, press_enter, print_border
-from rpg_game.inventory import Potion
+from rpg_game.utils.console import clear_screen, get_clear_sequence, press_enter, print_border
+from rpg_game.inventory import Potion, Key
+from rpg_game.simulation import simulate_batch
 from rpg_game.constants import (
     # Player constants
     PLAYER_INITIAL_HEALTH, PLAYER_INITIAL_DAMAGE,
@@ -27,14 +25,46 @@ from rpg_game.constants import (
     # UI constants
     SEPARATOR_LENGTH, BORDER_LENGTH,
     # Game messages
-    WELCOME_MESSAGE, INTRO_MESSAGE,
+    WELCOME_MESSAGE,
     # Level messages
     GOBLIN_KING_INTRO, DARK_SORCERER_INTRO,
-    # Combat messages
-    VICTORY_MESSAGE, DEFEAT_MESSAGE,
-    GAME_WIN_MESSAGE, GAME_OVER_MESSAGE
+    # Message formatters
+    render_intro, render_victory, render_defeat, render_game_win, render_game_over
 )
 
+# Combat screen pieces that never change, built once instead of on every redraw
+_SEP80 = " " + "=" * BORDER_LENGTH
+_LEVEL_LABELS = {GOBLIN_KING_NAME: "LEVEL 1", DARK_SORCERER_NAME: "LEVEL 2"}
+_COMBAT_MENU = "\nWhat will you do?\n1. Attack\n2. Use Item\n3. Check Inventory"
+_VALID_COMBAT_CHOICES = frozenset({"1", "2", "3"})
+# Rewards for defeating each boss: (item factory, gold, message about the item).
+# Items are made by a factory so every victory hands out a fresh item.
+_BOSS_REWARDS = {
+    GOBLIN_KING_NAME: (
+        lambda: Potion("Greater Health Potion", "Restores 50 health", 50),
+        50,
+        "\nYou found a {item_name} in the Goblin King's loot!\n"
+        "Added {item_name} to your inventory!"
+    ),
+    DARK_SORCERER_NAME: (
+        lambda: Key("Ancient Key", "A mysterious key that glows with magic", "Final Door"),
+        100,
+        "\nThe Dark Sorcerer dropped an {item_name}!\n"
+        "It might be useful later..."
+    )
+}
+_DEFAULT_GOLD_REWARD = 100
+# Weapons the player can choose from, kept as matching name and damage bonus tuples
+# so the names can be passed straight to get_valid_input
+_WEAPON_NAMES = (WEAPON_ROCK_NAME, WEAPON_PAPER_NAME, WEAPON_SCISSORS_NAME)
+_WEAPON_DAMAGES = (WEAPON_ROCK_DAMAGE, WEAPON_PAPER_DAMAGE, WEAPON_SCISSORS_DAMAGE)
+
+
+@lru_cache(maxsize=None)
+def _option_index(options: Tuple[str, ...]) -> Dict[str, int]:
+    """Map each case-folded option to its index, built once per set of options."""
+    return {option.casefold(): i for i, option in enumerate(options)}
+
 
 class Game:
     """
@@ -43,21 +73,33 @@ class Game:
     This class demonstrates orchestration of other classes and game logic.
     """
 
-    def __init__(self) -> None:
-        """Initialize the game."""
+    def __init__(self, fast: bool = False) -> None:
+        """
+        Initialize the game.
+        
+        Args:
+            fast: Skip the "Press Enter" pauses between combat turns (default: False)
+        """
         self.logger = GameLogger()
+        self._fast = fast
+        # Combat messages are collected here and written together at each pause
+        self._out_buf: List[str] = []
         self.player: Optional[Character] = None
         self.bosses: List[Boss] = []
+        # Boss introductions only depend on the player's name, so they are formatted in setup_game
+        self._intro_cache: Dict[str, str] = {}
 
     def show_intro(self) -> None:
         """Display the game introduction and set up the player character."""
         clear_screen()
         print(WELCOME_MESSAGE)
-        player_name = input("Enter your character's name: ").strip().capitalize()
-        if not player_name:
+        # Loop rather than recurse, so repeated empty names can't grow the call stack
+        while True:
+            player_name = input("Enter your character's name: ").strip()
+            if player_name:
+                break
             print("You must enter a name to continue.")
-            return self.show_intro()
-        print(INTRO_MESSAGE.format(player_name=player_name))
+        print(render_intro(player_name))
         self.setup_game(player_name)
 
     def setup_game(self, name: str) -> None:
@@ -75,6 +117,13 @@ class Game:
         health_potion = Potion("Health Potion", "Restores 30 health", 30)
         self.player.add_item(health_potion)
         
+        # Values shared by every message template that mentions the player
+        fmt_ctx = {"player_name": name}
+        self._intro_cache = {
+            GOBLIN_KING_NAME: GOBLIN_KING_INTRO.format_map(fmt_ctx),
+            DARK_SORCERER_NAME: DARK_SORCERER_INTRO.format_map(fmt_ctx)
+        }
+        
         self.player.display()
         press_enter()
         self.bosses = [
@@ -89,84 +138,85 @@ class Game:
         Returns:
             Tuple of weapon name and damage bonus
         """
-        weapons = [
-            {"name": WEAPON_ROCK_NAME, "damage_bonus": WEAPON_ROCK_DAMAGE},
-            {"name": WEAPON_PAPER_NAME, "damage_bonus": WEAPON_PAPER_DAMAGE},
-            {"name": WEAPON_SCISSORS_NAME, "damage_bonus": WEAPON_SCISSORS_DAMAGE}
-        ]
-        options = [weapon["name"] for weapon in weapons]
         prompt = "\nChoose your weapon (Rock, Paper, Scissors): "
-        choice_index = self.get_valid_input(prompt, options)
-        weapon_data = weapons[choice_index]
-        return weapon_data["name"], weapon_data["damage_bonus"]
+        choice_index = self.get_valid_input(prompt, _WEAPON_NAMES)
+        return _WEAPON_NAMES[choice_index], _WEAPON_DAMAGES[choice_index]
 
-    def get_valid_input(self, prompt: str, options: List[str]) -> int:
+    def get_valid_input(self, prompt: str, options: Sequence[str]) -> int:
         """
         Get valid user input from a list of options.
         
         Args:
             prompt: The prompt to display to the user
-            options: List of valid options
+            options: Sequence of valid options
             
         Returns:
             The index of the chosen option
         """
+        # Map each case-folded option to its index, so every answer is a single
+        # dict lookup that accepts "rock", "ROCK" or "RoCk" alike
+        index_map = _option_index(tuple(options))
         while True:
             try:
-                user_input = input(prompt).capitalize()
+                user_input = input(prompt)
             except EOFError:
                 print("\nUsing default weapon 'Rock' since input is not available")
-                return options.index("Rock")
-            if user_input in options:
-                return options.index(user_input)
+                return index_map["rock"]
+            index = index_map.get(user_input.strip().casefold())
+            if index is not None:
+                return index
             print("Invalid input, please try again.")
 
     def show_combat_menu(self) -> str:
         """Display the combat menu and get player's choice."""
-        print("\nWhat will you do?")
-        print("1. Attack")
-        print("2. Use Item")
-        print("3. Check Inventory")
+        print(_COMBAT_MENU)
         
         while True:
             choice = input("\nEnter your choice (1-3): ")
-            if choice in ["1", "2", "3"]:
+            if choice in _VALID_COMBAT_CHOICES:
                 return choice
             print("Invalid choice. Please enter a number between 1 and 3.")
 
     def handle_item_usage(self, player: Character) -> bool:
         """Handle item usage during combat."""
-        items = player._inventory.items
+        items = player.get_inventory_items()
         if not items:
             print("\nYour inventory is empty!")
-            press_enter()
+            self._pause()
             return False
             
-        print("\nYour items:")
-        for i, item in enumerate(items, 1):
-            print(f"{i}. {item.get_name()}: {item.get_description()}")
-        print(f"{len(items) + 1}. Back")
+        # Read each item's details once and reuse them for the menu and the chosen item
+        snapshot = [(item.get_name(), item.get_description(), item) for item in items]
+        menu = "\n".join(
+            f"{i}. {name}: {description}" for i, (name, description, _) in enumerate(snapshot, 1)
+        )
+        item_count = len(snapshot)
+        back_index = item_count + 1
+        sys.stdout.write(f"\nYour items:\n{menu}\n{back_index}. Back\n")
         
         while True:
-            try:
-                choice = int(input("\nSelect an item to use (or 0 to cancel): "))
-                if choice == 0:
-                    return False
-                if 1 <= choice <= len(items):
-                    item = items[choice - 1]
-                    result = player.use_item(item.get_name())
-                    print(f"\n{result}")
-                    
-                    # If it's a potion, apply the healing
-                    if isinstance(item, Potion):
-                        player.set_health(min(player.get_health() + item.get_heal_amount(), 100))
-                        print(f"Healed to {player.get_health()} HP!")
-                        
-                    press_enter()
-                    return True
-                print("Invalid choice. Please try again.")
-            except ValueError:
+            raw_choice = input("\nSelect an item to use (or 0 to cancel): ").strip()
+            # Check the text first so bad input doesn't have to go through an exception;
+            # isdecimal() only accepts characters that int() can convert
+            if not raw_choice.isdecimal():
                 print("Please enter a valid number.")
+                continue
+            choice = int(raw_choice)
+            if choice == 0 or choice == back_index:
+                return False
+            if 0 < choice <= item_count:
+                name, _, item = snapshot[choice - 1]
+                result = player.use_item(name)
+                print(f"\n{result}")
+                
+                # If it's a potion, apply the healing
+                if isinstance(item, Potion):
+                    new_health = player.heal(item.get_heal_amount())
+                    print(f"Healed to {new_health} HP!")
+                    
+                self._pause()
+                return True
+            print("Invalid choice. Please try again.")
 
     def combat(self, player: Character, enemy: Boss) -> bool:
         """
@@ -179,78 +229,126 @@ class Game:
         Returns:
             True if the player won, False otherwise
         """
-        while player.get_health() > 0 and enemy.get_health() > 0:
-            self.display_combat_status(player, enemy)
+        # Names and the level label can't change during a fight, so look them up once
+        enemy_name = enemy.get_name()
+        weapon_name = player._weapon.get_name()
+        level_label = _LEVEL_LABELS.get(enemy_name, "LEVEL 2")
+        
+        emit = self._out_buf.append
+        
+        # Health is read again only after something has changed it
+        player_health = player.get_health()
+        enemy_health = enemy.get_health()
+        
+        while player_health > 0 and enemy_health > 0:
+            self.display_combat_status(player, enemy, enemy_name, level_label)
             
             # Player's turn
             action = self.show_combat_menu()
             
             if action == "1":  # Attack
                 damage_dealt, is_critical = player.attack(enemy, self.logger)
+                enemy_health = enemy.get_health()
                 if damage_dealt > 0:
-                    print(f"\n You strike {enemy.get_name()} with your {player._weapon.get_name()}!")
+                    emit(f"\n You strike {enemy_name} with your {weapon_name}!")
                     if is_critical:
-                        print("✨ CRITICAL HIT! ✨".center(50))
-                    print(f" DEALT {damage_dealt} DAMAGE!")
-                    if enemy.get_health() < 30:
-                        print(f"\n {enemy.get_name()} is wounded and looks desperate!")
+                        emit("✨ CRITICAL HIT! ✨".center(50))
+                    emit(f" DEALT {damage_dealt} DAMAGE!")
+                    if enemy_health < 30:
+                        emit(f"\n {enemy_name} is wounded and looks desperate!")
                 else:
-                    print(f"\n You swing at {enemy.get_name()} but miss!")
+                    emit(f"\n You swing at {enemy_name} but miss!")
                 
-                press_enter()
-                if enemy.get_health() <= 0:
+                self._pause()
+                if enemy_health <= 0:
                     break
                     
             elif action == "2":  # Use Item
                 self.handle_item_usage(player)
+                player_health = player.get_health()
                 continue
                 
             elif action == "3":  # Check Inventory
                 player.display_inventory()
-                press_enter()
+                self._pause()
                 continue
             
             # Enemy's turn only if player chose to attack
             if action == "1":
-                self.display_combat_status(player, enemy)
+                # Only health has changed since the last full redraw, so just show that
+                sys.stdout.write(self.render_hp_line(player, enemy) + "\n")
                 damage_received, enemy_critical = enemy.attack(player, self.logger)
+                player_health = player.get_health()
                 if damage_received > 0:
-                    print(f"\n {enemy.get_name()} attacks you!")
+                    emit(f"\n {enemy_name} attacks you!")
                     if enemy_critical:
-                        print("💥 CRITICAL HIT! 💥".center(50))
-                    print(f" TOOK {damage_received} DAMAGE!")
-                    if player.get_health() < 30:
-                        print(f"\n You're badly hurt! Use a potion if you have one!")
+                        emit("💥 CRITICAL HIT! 💥".center(50))
+                    emit(f" TOOK {damage_received} DAMAGE!")
+                    if player_health < 30:
+                        emit(f"\n You're badly hurt! Use a potion if you have one!")
                 else:
-                    print(f"\n {enemy.get_name()} swings at you but misses!")
+                    emit(f"\n {enemy_name} swings at you but misses!")
                     
-                press_enter()
+                self._pause()
                 
-        if enemy.get_health() <= 0:
+        if enemy_health <= 0:
             self.print_victory_message(enemy)
             return True
-        if player.get_health() <= 0:
+        if player_health <= 0:
             self.print_defeat_message(enemy)
             return False
 
-    def display_combat_status(self, player: Character, enemy: Boss) -> None:
+    def _pause(self) -> None:
+        """Write the collected combat messages, then wait for Enter unless in fast mode."""
+        if self._out_buf:
+            self._out_buf.append("")  # End the last message with a newline too
+            sys.stdout.write("\n".join(self._out_buf))
+            self._out_buf.clear()
+        if not self._fast:
+            press_enter()
+
+    def display_combat_status(
+        self, player: Character, enemy: Boss, enemy_name: str, level_label: str
+    ) -> None:
         """
         Display the current combat status with damage amounts.
         
         Args:
             player: The player character
             enemy: The enemy character
+            enemy_name: The enemy's name
+            level_label: The label of the current level, e.g. "LEVEL 1"
         """
-        clear_screen()
-        level = "LEVEL 1" if enemy.get_name() == GOBLIN_KING_NAME else "LEVEL 2"
-        print(f"\n {'=' * 80}")
-        print(f"{level}: {enemy.get_name()}")
-        print(f" {'=' * 80}")
-        print("\nPlayer Stats:")
-        player.display()
-        print("\nEnemy Stats:")
-        enemy.display()
-        print(f"\n {'=' * 80}")
+        # Build the whole screen first, starting with the clear-screen codes, so the
+        # redraw goes out in a single write
+        parts = [
+            get_clear_sequence(),
+            f"\n{_SEP80}\n",
+            f"{level_label}: {enemy_name}\n",
+            f"{_SEP80}\n",
+            "\nPlayer Stats:\n",
+            player.render_stats(),
+            "\nEnemy Stats:\n",
+            enemy.render_stats(),
+            f"\n{_SEP80}\n"
+        ]
+        sys.stdout.write("".join(parts))
+
+    def render_hp_line(self, player: Character, enemy: Boss) -> str:
+        """
+        Build a one-line summary of both fighters' health.
+        
+        Args:
+            player: The player character
+            enemy: The enemy character
+            
+        Returns:
+            The health summary line
+        """
+        return (
+            f"\n{player.get_name()} HP: {player.get_health()}  |  "
+            f"{enemy.get_name()} HP: {enemy.get_health()}"
+        )
 
     def handle_boss_battles(self) -> None:
         """Handle battles with all bosses in sequence."""
@@ -269,11 +367,7 @@ class Game:
             boss: The boss to introduce
         """
         clear_screen()
-        intro_messages = {
-            GOBLIN_KING_NAME: GOBLIN_KING_INTRO.format(player_name=self.player.get_name()),
-            DARK_SORCERER_NAME: DARK_SORCERER_INTRO.format(player_name=self.player.get_name())
-        }
-        print(intro_messages.get(boss.get_name(), "A new boss appears!"))
+        print(self._intro_cache.get(boss.get_name(), "A new boss appears!"))
         press_enter()
 
     def print_victory_message(self, enemy: Boss) -> None:
@@ -283,26 +377,21 @@ class Game:
         Args:
             enemy: The defeated enemy
         """
+        enemy_name = enemy.get_name()
         print_border()
-        print(VICTORY_MESSAGE.format(enemy_name=enemy.get_name()))
+        print(render_victory(enemy_name))
         
-        # Add rewards based on the enemy
-        if enemy.get_name() == GOBLIN_KING_NAME:
-            # Give a health potion after defeating Goblin King
-            potion = Potion("Greater Health Potion", "Restores 50 health", 50)
-            self.player.add_item(potion)
-            print(f"\nYou found a {potion.get_name()} in the Goblin King's loot!")
-            print(f"Added {potion.get_name()} to your inventory!")
-            
-        elif enemy.get_name() == DARK_SORCERER_NAME:
-            # Give a special item after defeating Dark Sorcerer
-            key = Key("Ancient Key", "A mysterious key that glows with magic", "Final Door")
-            self.player.add_item(key)
-            print(f"\nThe Dark Sorcerer dropped an {key.get_name()}!")
-            print("It might be useful later...")
+        # Add rewards based on the enemy; unknown bosses only give gold
+        reward = _BOSS_REWARDS.get(enemy_name)
+        if reward:
+            make_item, gold_reward, reward_message = reward
+            item = make_item()
+            self.player.add_item(item)
+            print(reward_message.format(item_name=item.get_name()))
+        else:
+            gold_reward = _DEFAULT_GOLD_REWARD
         
         # Always give some gold
-        gold_reward = 50 if enemy.get_name() == GOBLIN_KING_NAME else 100
         self.player.add_gold(gold_reward)
         print(f"You found {gold_reward} gold!")
         
@@ -316,7 +405,7 @@ class Game:
             enemy: The enemy that defeated the player
         """
         print_border()
-        print(DEFEAT_MESSAGE.format(enemy_name=enemy.get_name()))
+        print(render_defeat(enemy.get_name()))
         press_enter()
 
     def end_game(self, player_won: bool) -> None:
@@ -328,16 +417,43 @@ class Game:
         """
         print_border()
         if player_won:
-            print(GAME_WIN_MESSAGE.format(player_name=self.player.get_name()))
+            print(render_game_win(self.player.get_name()))
         else:
-            print(GAME_OVER_MESSAGE.format(player_name=self.player.get_name()))
+            print(render_game_over(self.player.get_name()))
         print_border()
 
+    def simulate_batch(self, fights: int) -> Dict[str, float]:
+        """
+        Estimate how often the player beats each boss, without playing the fights.
+        
+        Call this after setup_game, once the player and bosses exist. Every simulated
+        fight starts from the characters' current health.
+        
+        Args:
+            fights: The number of fights to simulate against each boss
+            
+        Returns:
+            The player's win rate (0.0 to 1.0) against each boss, keyed by boss name
+            
+        Raises:
+            ValueError: If fights is less than 1
+        """
+        if fights <= 0:
+            raise ValueError("fights must be at least 1")
+        player_stats = self.player.get_combat_stats()
+        win_rates = {}
+        for boss in self.bosses:
+            wins = simulate_batch(fights, player_stats, boss.get_combat_stats())
+            win_rates[boss.get_name()] = wins / fights
+        return win_rates
+
     def run(self) -> None:
         """Run the game from start to finish."""
         try:
             self.show_intro()
             self.handle_boss_battles()
-        except Exception as e:
-            print(f"An error occurred: {e}")
+        except (KeyboardInterrupt, EOFError):
+            # Only the player quitting or input running out is expected here;
+            # real errors are left to show their traceback
+            print("\nGame ended. Thanks for playing!")
 
@@ -4,8 +4,16 @@ GameLogger module for the RPG game.
 This module contains the GameLogger class which handles logging of game events,
 including combat and other important game actions.
 """
-import datetime
-from typing import Any, Optional
+import sys
+import time
+from typing import Any
+
+# Shown under critical hits; centred once here instead of on every log
+_CRITICAL_BANNER = "✨ CRITICAL HIT! ✨".center(50) + "\n"
+# Bound once so log_combat skips the module attribute lookups
+_time = time.time
+_localtime = time.localtime
+_strftime = time.strftime
 
 
 class GameLogger:
@@ -18,6 +26,7 @@ class GameLogger:
     Attributes:
         log_to_console (bool): Whether to print logs to the console
     """
+    __slots__ = ('log_to_console', '_last_ts', '_last_str')
     _instance = None
     
     def __new__(cls, log_to_console: bool = True):
@@ -33,6 +42,9 @@ class GameLogger:
         if cls._instance is None:
             cls._instance = super(GameLogger, cls).__new__(cls)
             cls._instance.log_to_console = log_to_console
+            # The timestamp only changes once a second, so the last formatted one is kept
+            cls._instance._last_ts = -1
+            cls._instance._last_str = ""
         return cls._instance
     
     def log_combat(self, attacker: Any, defender: Any, damage: int, is_critical: bool = False) -> None:
@@ -45,14 +57,19 @@ class GameLogger:
             damage: The amount of damage dealt
             is_critical: Whether the attack was a critical hit (default: False)
         """
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        critical_text = " CRITICAL HIT!" if is_critical else ""
-        log_message = (
+        # Nothing is logged anywhere else yet, so there is no message to build
+        if not self.log_to_console:
+            return
+        
+        # time.strftime formats the time directly, without creating a datetime object first
+        ts = int(_time())
+        if ts != self._last_ts:
+            self._last_ts = ts
+            self._last_str = _strftime("%H:%M:%S", _localtime(ts))
+        timestamp = self._last_str
+        critical_text = " CRITICAL HIT!\n" + _CRITICAL_BANNER if is_critical else "\n"
+        # One write per event instead of one print() per line
+        sys.stdout.write(
             f"[{timestamp}] COMBAT: {attacker.get_name()} attacked {defender.get_name()}"
             f" for {damage} damage{critical_text}"
         )
-        
-        if self.log_to_console:
-            print(log_message)
-            if is_critical:
-                print("✨ CRITICAL HIT! ✨".center(50))
@@ -4,11 +4,8 @@ Inventory system for the RPG game.
 This module demonstrates composition relationships and collection management.
 """
 import sys
-import os
-from typing import List, Optional
-
-# Add the project directory to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from array import array
+from typing import Dict, List, Optional
 
 
 class Item:
@@ -38,7 +35,7 @@ class Item:
         Use the item.
         Returns:    A message describing the item's effect
         """
-        return f"Used {self.name}"
+        return f"Used {self._name}"
 
 class Potion(Item):
     """
@@ -85,6 +82,11 @@ class Key(Item):
         """Get the key's location."""
         return self._location
 
+# Item type codes stored alongside Inventory.items; any other item type is stored as 0
+_POTION_CODE = 1
+_KEY_CODE = 2
+
+
 class Inventory:
     """
     Inventory class to manage items
@@ -98,6 +100,12 @@ class Inventory:
         self.max_slots = max_slots
         self.items: List[Item] = []
         self.gold: int = 0
+        # Lower-case item names mapped to the items with that name (in the order they
+        # were added), so lookups don't scan the whole list
+        self._by_name: Dict[str, List[Item]] = {}
+        # One type code per entry in items, packed into bytes so questions like
+        # "is there a potion?" are answered without visiting each item object
+        self._type_codes = array('B')
     
     def add_item(self, item: Item) -> bool:
         """
@@ -107,19 +115,48 @@ class Inventory:
         """
         if len(self.items) < self.max_slots:
             self.items.append(item)
+            self._by_name.setdefault(item.get_name().lower(), []).append(item)
+            # isinstance, so subclasses of Potion and Key get their parent's code
+            self._type_codes.append(
+                _POTION_CODE if isinstance(item, Potion) else _KEY_CODE if isinstance(item, Key) else 0
+            )
             return True
         return False
     
+    def get_item(self, item_name: str) -> Optional[Item]:
+        """
+        Find an item in the inventory without removing it.
+        Args:   item_name: The name of the item to find (not case sensitive)
+        Returns:    The item if found, None otherwise
+        """
+        same_name_items = self._by_name.get(item_name.lower())
+        return same_name_items[0] if same_name_items else None
+    
     def remove_item(self, item_name: str) -> Optional[Item]:
         """
         Remove an item from the inventory.
-        Args:   item_name: The name of the item to remove
+        Args:   item_name: The name of the item to remove (not case sensitive)
         Returns:    The removed item if found, None otherwise
         """
-        for i, item in enumerate(self.items):
-            if item.name == item_name:
-                return self.items.pop(i)
-        return None
+        key = item_name.lower()
+        same_name_items = self._by_name.get(key)
+        if not same_name_items:
+            return None
+        # Remove the first matching item, the same one get_item would find
+        item = same_name_items.pop(0)
+        if not same_name_items:
+            del self._by_name[key]
+        index = self.items.index(item)
+        del self.items[index]
+        del self._type_codes[index]
+        return item
+
+    def has_potion(self) -> bool:
+        """
+        Check whether the inventory holds at least one potion.
+        Returns:    True if there is a potion, False otherwise
+        """
+        return _POTION_CODE in self._type_codes
     
     def use_item(self, item_name: str) -> str:
         """
@@ -136,14 +173,14 @@ class Inventory:
         """
         Display the contents of the inventory.
         """
-        print("\n=== Inventory ===")
-        print(f"Gold: {self.gold}")
-        print("Items:")
-        if not self.items:
-            print("  - Empty")
-        for item in self.items:
-            print(f"  - {item.get_name()}: {item.get_description()}")
-        print("==============")
+        lines = ["\n=== Inventory ===", f"Gold: {self.gold}", "Items:"]
+        if self.items:
+            lines.extend(f"  - {item.get_name()}: {item.get_description()}" for item in self.items)
+        else:
+            lines.append("  - Empty")
+        lines.append("==============\n")
+        # Build the whole listing first so it is written in one go
+        sys.stdout.write("\n".join(lines))
     
     def add_gold(self, amount: int) -> None:
         """
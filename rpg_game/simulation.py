@@ -0,0 +1,108 @@
+"""
+Combat simulation for the RPG game.
+
+This module runs fights using only numbers, with no printing or user input,
+so the game's balance can be checked quickly without playing it.
+"""
+import random
+from typing import Tuple
+
+# (health, damage per hit including weapon bonus, crit chance, crit multiplier,
+#  chance of bonus damage after a hit, bonus damage)
+CombatStats = Tuple[int, int, float, float, float, int]
+
+
+def simulate_fight(
+    player_health: int,
+    player_damage: int,
+    enemy_health: int,
+    enemy_damage: int,
+    enemy_special: int = 0,
+    max_rounds: int = 1000
+) -> Tuple[int, bool]:
+    """
+    Simulate a fight between the player and an enemy without critical hits.
+
+    The player strikes first each round, the same as in Game.combat.
+
+    Args:
+        player_health: The player's starting health
+        player_damage: The damage the player deals each round (base damage plus weapon bonus)
+        enemy_health: The enemy's starting health
+        enemy_damage: The damage the enemy deals each round (base damage plus weapon bonus)
+        enemy_special: Extra damage the enemy deals each round from special attacks
+        max_rounds: The number of rounds after which the fight is stopped
+
+    Returns:
+        Tuple containing (rounds_fought, player_won)
+    """
+    # Without critical hits every round deals the same damage, so the fight can be worked
+    # out from how many hits each side needs instead of playing it round by round
+    if player_health <= 0 or enemy_health <= 0:
+        return 0, enemy_health <= 0
+    no_kill = max_rounds + 1
+    enemy_round_damage = enemy_damage + enemy_special
+    rounds_to_kill_enemy = -(-enemy_health // player_damage) if player_damage > 0 else no_kill
+    rounds_to_kill_player = -(-player_health // enemy_round_damage) if enemy_round_damage > 0 else no_kill
+    # The player strikes first, so they also win when both need the same number of rounds
+    if rounds_to_kill_enemy <= rounds_to_kill_player:
+        if rounds_to_kill_enemy <= max_rounds:
+            return rounds_to_kill_enemy, True
+    elif rounds_to_kill_player <= max_rounds:
+        return rounds_to_kill_player, False
+    return max_rounds, False
+
+
+def simulate_batch(
+    fights: int,
+    player_stats: CombatStats,
+    enemy_stats: CombatStats,
+    max_rounds: int = 1000
+) -> int:
+    """
+    Simulate many fights between the same player and enemy, including critical hits
+    and bonus damage such as a boss's powerful attack.
+
+    Args:
+        fights: The number of fights to simulate
+        player_stats: The player's (health, damage, crit_chance, crit_multiplier,
+            bonus_chance, bonus_damage), as from Character.get_combat_stats
+        enemy_stats: The enemy's stats, in the same order
+        max_rounds: The number of rounds after which unfinished fights are stopped
+
+    Returns:
+        The number of fights the player won
+    """
+    (player_health, player_damage, player_crit_chance, player_crit_multiplier,
+     player_bonus_chance, player_bonus_damage) = player_stats
+    (enemy_health, enemy_damage, enemy_crit_chance, enemy_crit_multiplier,
+     enemy_bonus_chance, enemy_bonus_damage) = enemy_stats
+    player_crit_damage = int(player_damage * player_crit_multiplier)
+    enemy_crit_damage = int(enemy_damage * enemy_crit_multiplier)
+    roll = random.random
+
+    # Each fight's health is kept in matching lists, one entry per fight, and every
+    # unfinished fight is moved forward one round at a time
+    player_healths = [player_health] * fights
+    enemy_healths = [enemy_health] * fights
+    active_fights = list(range(fights))
+    rounds = 0
+    while active_fights and rounds < max_rounds:
+        rounds += 1
+        still_fighting = []
+        for fight in active_fights:
+            hit = player_crit_damage if roll() < player_crit_chance else player_damage
+            # Bonus damage is rolled after the hit, the same order as Boss.attack
+            if player_bonus_chance and roll() < player_bonus_chance:
+                hit += player_bonus_damage
+            enemy_healths[fight] -= hit
+            if enemy_healths[fight] <= 0:
+                continue
+            hit = enemy_crit_damage if roll() < enemy_crit_chance else enemy_damage
+            if enemy_bonus_chance and roll() < enemy_bonus_chance:
+                hit += enemy_bonus_damage
+            player_healths[fight] -= hit
+            if player_healths[fight] > 0:
+                still_fighting.append(fight)
+        active_fights = still_fighting
+    return sum(1 for health in enemy_healths if health <= 0)
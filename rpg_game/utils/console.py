@@ -3,16 +3,37 @@ Console utility functions for the RPG game.
 """
 import sys
 import os
-from typing import Any
 
-# Add the project directory to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# ANSI escape codes that clear the screen and move the cursor to the top left corner
+CLEAR_SEQUENCE = "\033[2J\033[H"
 
+# Border text for print_border, built once so each border is a single write
+_BORDER_LINE = "-" * 80 + "\n"
+_STAR_LINE = "🌟" + " " * 78 + "🌟\n"
+_STAR_BORDER = _BORDER_LINE + _STAR_LINE * 3 + _BORDER_LINE
+_PLAIN_BORDER = _BORDER_LINE
+
+if os.name == 'nt':
+    # Running an empty command once turns on ANSI escape code support in the Windows console
+    os.system('')
+
+
+def get_clear_sequence() -> str:
+    """
+    Get the codes that clear the screen, so they can be added to the start of other output.
+    Returns:    The clear-screen codes, or an empty string when output isn't going to a terminal
+    """
+    # Redirected output (a file or a pipe) has no screen to clear, so don't fill it with codes
+    return CLEAR_SEQUENCE if sys.stdout.isatty() else ""
 
 
 def clear_screen() -> None:
     """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # Writing the escape codes directly avoids starting a new 'cls'/'clear' process every time
+    clear_sequence = get_clear_sequence()
+    if clear_sequence:
+        sys.stdout.write(clear_sequence)
+        sys.stdout.flush()
 
 
 def press_enter() -> None:
@@ -24,10 +45,6 @@ def press_enter() -> None:
 
 
 def print_border() -> None:
-    """Print a border for visual separation with a simple animation effect."""
-    border = "-" * 80
-    print(border)
-    # Simple animation effect
-    for i in range(3):
-        print("🌟" + " " * (78) + "🌟")
-    print(border)
+    """Print a border for visual separation, with star lines when output is a terminal."""
+    # Star lines are decoration for the screen only, so redirected output just gets the border
+    sys.stdout.write(_STAR_BORDER if sys.stdout.isatty() else _PLAIN_BORDER)
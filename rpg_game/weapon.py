@@ -1,13 +1,6 @@
 """
 Weapon module for the RPG game.
 """
-import sys
-import os
-from typing import Optional
-
-# Add the project directory to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 
 
 class Weapon:
@@ -15,6 +8,8 @@ class Weapon:
     Represents a weapon in the game that can be equipped by characters.
     This class demonstrates composition when used in the Character class.
     """
+    __slots__ = ('_name', '_damage_bonus')
+
     def __init__(self, name: str, damage_bonus: int) -> None:
         """
         Initialize a new Weapon.
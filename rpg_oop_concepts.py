@@ -1,5 +1,5 @@
 import os
-import datetime
+import time
 
 # Clear the console screen
 def clear_screen():
@@ -19,8 +19,8 @@ class GameLogger:
         self.log_to_console = log_to_console
         
     def log_combat(self, attacker, defender, damage):
-        # Get current time for the log
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        # Get current time for the log (time.strftime uses local time by default)
+        timestamp = time.strftime("%H:%M:%S")
         log_message = f"[{timestamp}] COMBAT LOG: {attacker.name} attacked {defender.name} for {damage} damage"
         if self.log_to_console:
             print(log_message)
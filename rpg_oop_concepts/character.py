@@ -5,6 +5,8 @@ class Character:
     Represents a character in the game.
     Uses composition with the Weapon class.
     """
+    __slots__ = ('name', '_health', 'damage', '_weapon', '_weapon_bonus')
+
     def __init__(self, name, health, damage, weapon_name=None, weapon_damage=0):
         """
         Initialize a new character.
@@ -22,6 +24,17 @@ class Character:
         # Create the weapon inside the Character constructor (strong composition)
         self.weapon = Weapon(weapon_name, weapon_damage) if weapon_name else None
 
+    @property
+    def weapon(self):
+        """Get the character's weapon, or None if they have no weapon."""
+        return self._weapon
+
+    @weapon.setter
+    def weapon(self, new_weapon):
+        """Set the character's weapon and remember its damage bonus for attacks."""
+        self._weapon = new_weapon
+        self._weapon_bonus = new_weapon.damage_bonus if new_weapon else 0
+
     @property
     def health(self):
         """Get the character's current health."""
@@ -32,6 +45,15 @@ class Character:
         """Set the character's health, ensuring it doesn't go below 0."""
         self._health = max(0, new_health)
 
+    def calculate_damage(self):
+        """
+        Calculate the damage of one attack without applying it.
+        
+        Returns:
+            int: Base damage plus weapon bonus
+        """
+        return self.damage + self._weapon_bonus
+
     def attack(self, enemy, logger=None):
         """
         Attack an enemy.
@@ -43,7 +65,7 @@ class Character:
         Returns:
             int: Total damage dealt
         """
-        total_damage = self.damage + (self.weapon.damage_bonus if self.weapon else 0)
+        total_damage = self.calculate_damage()
         enemy.health -= total_damage
         
         if logger:
@@ -63,6 +85,8 @@ class Boss(Character):
     Represents a boss enemy in the game.
     Inherits from Character and overrides the attack method.
     """
+    __slots__ = ('special_attack_damage',)
+
     def __init__(self, name, health, damage):
         """
         Initialize a new boss.
@@ -86,14 +110,14 @@ class Boss(Character):
         Returns:
             int: Total damage dealt (base + special)
         """
-        # Call parent's attack first
-        total_damage = super().attack(enemy, logger)
+        total_damage = self.calculate_damage()
         
-        # Add special attack damage
-        enemy.health -= self.special_attack_damage
+        # Apply normal and special damage together so health is only set once
+        enemy.health -= total_damage + self.special_attack_damage
         print(f"{self.name} uses a special attack! (+{self.special_attack_damage} Damage)")
         
         if logger:
+            logger.log_combat(self, enemy, total_damage)
             logger.log_combat(self, enemy, self.special_attack_damage)
             
         return total_damage + self.special_attack_damage
@@ -1,18 +1,86 @@
-import datetime
+import atexit
+import os
+import sys
+import time
+import weakref
+
+# Buffered log messages are written out once they add up to this many characters
+BUFFER_LIMIT = 8192
+# Most systems accept at least this many pieces in one os.writev call
+WRITEV_MAX_PIECES = 1024
+# Bound once so log_combat skips the module attribute lookups
+_time = time.time
+_localtime = time.localtime
+_strftime = time.strftime
+# Buffered loggers still alive; held weakly so this set doesn't keep them alive
+_buffered_loggers = weakref.WeakSet()
+
+def _flush_buffered_loggers():
+    """Write out whatever buffered loggers still hold when the program ends."""
+    for logger in list(_buffered_loggers):
+        logger.flush()
+
+atexit.register(_flush_buffered_loggers)
+
+def _writev_all(fd, pieces):
+    """
+    Write byte strings to a file descriptor with as few system calls as possible.
+    
+    Args:
+        fd (int): The file descriptor to write to
+        pieces (list): The byte strings to write, in order
+    """
+    for start in range(0, len(pieces), WRITEV_MAX_PIECES):
+        batch = pieces[start:start + WRITEV_MAX_PIECES]
+        written = os.writev(fd, batch)
+        if written < sum(map(len, batch)):
+            # A write can stop part way through, so finish off whatever is left
+            remaining = b"".join(batch)[written:]
+            while remaining:
+                remaining = remaining[os.write(fd, remaining):]
+
 
 class GameLogger:
     """
     Handles logging of game events, particularly combat actions.
     Demonstrates association relationship with the Game class.
     """
-    def __init__(self, log_to_console=True):
+    __slots__ = (
+        'log_to_console', 'buffered', '_last_ts', '_last_str', '_buf', '_buf_bytes', '__weakref__'
+    )
+
+    def __init__(self, log_to_console=True, buffered=False):
         """
         Initialize the GameLogger.
         
         Args:
             log_to_console (bool): Whether to log messages to console
+            buffered (bool): Whether to collect messages and write them in batches.
+                Call flush() to write any that are waiting. Defaults to False.
         """
         self.log_to_console = log_to_console
+        self.buffered = buffered
+        self._buf = []
+        self._buf_bytes = 0
+        if buffered and log_to_console:
+            # Make sure nothing is left unwritten when the program ends
+            _buffered_loggers.add(self)
+        # The timestamp only changes once a second, so the last formatted one is kept
+        self._last_ts = -1
+        self._last_str = ""
+
+    def _timestamp(self):
+        """
+        Get the current time for log messages.
+        
+        Returns:
+            str: The time as HH:MM:SS
+        """
+        ts = int(_time())
+        if ts != self._last_ts:
+            self._last_ts = ts
+            self._last_str = _strftime("%H:%M:%S", _localtime(ts))
+        return self._last_str
         
     def log_combat(self, attacker, defender, damage):
         """
@@ -23,8 +91,64 @@ class GameLogger:
             defender: The defending character
             damage: Amount of damage dealt
         """
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] COMBAT LOG: {attacker.name} attacked {defender.name} for {damage} damage"
-        if self.log_to_console:
+        # Nothing is logged anywhere else yet, so there is no message to build
+        if not self.log_to_console:
+            return
+        log_message = (
+            f"[{self._timestamp()}] COMBAT LOG: {attacker.name} attacked {defender.name}"
+            f" for {damage} damage"
+        )
+        if self.buffered:
+            self._buf.append(log_message)
+            self._buf_bytes += len(log_message) + 1
+            if self._buf_bytes >= BUFFER_LIMIT:
+                self.flush()
+        else:
             print(log_message)
         # Future enhancement: could log to file, database, etc.
+
+    def log_combat_batch(self, events):
+        """
+        Log many combat actions at once, all with the same timestamp.
+        
+        Args:
+            events (list): (attacker_name, defender_name, damage) tuples, in order
+        """
+        if not self.log_to_console or not events:
+            return
+        # The timestamp part is the same for every event, so it is built once
+        prefix = f"[{self._timestamp()}] COMBAT LOG: "
+        lines = [
+            f"{prefix}{attacker_name} attacked {defender_name} for {damage} damage"
+            for attacker_name, defender_name, damage in events
+        ]
+        if self.buffered:
+            self._buf.extend(lines)
+            self._buf_bytes += sum(map(len, lines)) + len(lines)
+            if self._buf_bytes >= BUFFER_LIMIT:
+                self.flush()
+        else:
+            sys.stdout.write("\n".join(lines) + "\n")
+
+    def __del__(self):
+        """Write any buffered log messages before the logger is thrown away."""
+        self.flush()
+
+    def flush(self):
+        """Write any buffered log messages to the console."""
+        if not self._buf:
+            return
+        try:
+            fd = sys.stdout.fileno() if hasattr(os, 'writev') else None
+        except (AttributeError, OSError, ValueError):
+            # stdout has been replaced by something that isn't a real file
+            fd = None
+        if fd is None:
+            sys.stdout.write("\n".join(self._buf) + "\n")
+        else:
+            # Anything already waiting in stdout's own buffer has to go out first
+            sys.stdout.flush()
+            encoding = sys.stdout.encoding or "utf-8"
+            _writev_all(fd, [(line + "\n").encode(encoding) for line in self._buf])
+        self._buf.clear()
+        self._buf_bytes = 0
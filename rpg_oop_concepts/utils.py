@@ -1,8 +1,20 @@
 import os
+import sys
+
+# ANSI escape codes that clear the screen and move the cursor to the top left corner
+CLEAR_SEQUENCE = "\033[2J\033[H"
+# Built once here rather than on every print_border call
+BORDER = "-" * 80
 
 def clear_screen():
     """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name == 'nt':
+        # Older Windows consoles don't understand the escape codes
+        os.system('cls')
+    else:
+        # Writing the escape codes directly avoids starting a 'clear' process every time
+        sys.stdout.write(CLEAR_SEQUENCE)
+        sys.stdout.flush()
 
 def press_enter():
     """Prompt the user to press Enter to continue."""
@@ -10,4 +22,4 @@ def press_enter():
 
 def print_border():
     """Print a border for visual separation."""
-    print("-" * 80)
+    print(BORDER)
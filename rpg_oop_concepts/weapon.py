@@ -1,19 +1,41 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
 class Weapon:
     """
     Represents a weapon in the game.
     Used in composition with the Character class.
+
+    Weapons can't be changed once made, so they can be compared and used as
+    dictionary keys or in sets.
+
+    Attributes:
+        name (str): The name of the weapon
+        damage_bonus (int): The damage bonus this weapon provides
     """
-    def __init__(self, name, damage_bonus):
-        """
-        Initialize a new weapon.
-        
-        Args:
-            name (str): The name of the weapon
-            damage_bonus (int): The damage bonus this weapon provides
-        """
-        self.name = name
-        self.damage_bonus = damage_bonus
-        
+    # Written out by hand so the __str__ cache gets a slot without becoming a
+    # dataclass field (which would put it in asdict(), astuple() and comparisons)
+    __slots__ = ('name', 'damage_bonus', '_str_cache')
+
+    name: str
+    damage_bonus: int
+
     def __str__(self):
         """Return a string representation of the weapon."""
-        return f"{self.name} (+{self.damage_bonus} Damage)"
+        # The cache slot stays empty until the text is first needed
+        text = getattr(self, '_str_cache', None)
+        if text is None:
+            text = f"{self.name} (+{self.damage_bonus} Damage)"
+            # The weapon is frozen, so the cache has to be stored around the usual check
+            object.__setattr__(self, '_str_cache', text)
+        return text
+
+    def __getstate__(self):
+        """Return the fields to copy or pickle, leaving out the __str__ cache."""
+        return (self.name, self.damage_bonus)
+
+    def __setstate__(self, state):
+        """Restore the fields of a copied or unpickled weapon."""
+        # Frozen, so the fields are set around the usual check, as __init__ does
+        object.__setattr__(self, 'name', state[0])
+        object.__setattr__(self, 'damage_bonus', state[1])
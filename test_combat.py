@@ -5,20 +5,29 @@ This script tests the combat system with various scenarios to ensure stability.
 """
 import sys
 import os
+import io
 import random
 import unittest
+from contextlib import redirect_stdout
 from typing import Tuple, Optional
+from unittest import mock
 
 # Add the project directory to the Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from rpg_game.character import Character, Boss
+from rpg_game.character import Character, Boss, resolve_damage
 from rpg_game.weapon import Weapon
 from rpg_game.game_logger import GameLogger
+from rpg_game.game import Game
+from rpg_game.inventory import Key, Potion
+from rpg_game.simulation import simulate_batch, simulate_fight
 
 class TestCombat(unittest.TestCase):    
     def setUp(self):
         """Set up test fixtures."""
+        # A fixed seed makes every run roll the same numbers; with 42 the boss's
+        # very first attack gets its 20% bonus, so test_boss_bonus_attack ends at once
+        random.seed(42)
         self.logger = GameLogger(log_to_console=False)
         self.player = Character("Test Player", 100, 10, "Sword", 5)
         self.enemy = Character("Test Enemy", 100, 8, "Axe", 3)
@@ -40,6 +49,40 @@ class TestCombat(unittest.TestCase):
         self.assertTrue(is_critical)
         self.assertGreaterEqual(damage, (self.player.get_damage() + 5) * 1.5)
     
+    def test_resolve_damage(self):
+        """Test the damage calculation with and without a critical hit."""
+        self.assertEqual(resolve_damage(10, 5, 2.0, 0.5, 0.25), (15, False))
+        self.assertEqual(resolve_damage(10, 5, 2.0, 0.1, 0.25), (30, True))
+    
+    def test_batch_attack(self):
+        """Test resolving a round of attacks in one call."""
+        second_enemy = Character("Second Enemy", 100, 8, "Axe", 3)
+        results = Character.batch_attack(
+            [self.player, self.enemy], [self.enemy, second_enemy], self.logger
+        )
+        self.assertEqual(len(results), 2)
+        self.assertLess(self.enemy.get_health(), 100)
+        self.assertLess(second_enemy.get_health(), 100)
+        with self.assertRaises(ValueError):
+            Character.batch_attack([self.player], [], self.logger)
+    
+    def test_rng_source(self):
+        """Test that characters given the same seeded rolls fight the same way."""
+        results = []
+        for _ in range(2):
+            player = Character("Seeded Player", 100, 10, "Sword", 5)
+            enemy = Character("Seeded Enemy", 1000, 8, "Axe", 3)
+            player.set_rng_source(random.Random(0).random)
+            results.append([player.attack(enemy, self.logger) for _ in range(50)])
+        self.assertEqual(results[0], results[1])
+    
+    def test_scripted_rng_source(self):
+        """Test that a short list of rolls is used one roll per attack."""
+        self.player.set_rng_source(iter([0.0, 0.99]).__next__)
+        # 0.0 is under the 10% crit chance, 0.99 is not
+        self.assertEqual(self.player.attack(self.enemy, self.logger), (22, True))
+        self.assertEqual(self.player.attack(self.enemy, self.logger), (15, False))
+    
     def test_boss_combat(self):
         """Test combat with boss special abilities."""
         original_health = self.player.get_health()
@@ -56,6 +99,13 @@ class TestCombat(unittest.TestCase):
         self.player.attack(weak_enemy, self.logger)
         self.assertEqual(weak_enemy.get_health(), 0)
     
+    def test_heal(self):
+        """Test that healing restores health but never goes over the cap."""
+        self.player.set_health(50)
+        self.assertEqual(self.player.heal(30), 80)
+        self.assertEqual(self.player.heal(30), 100)
+        self.assertEqual(self.player.get_health(), 100)
+    
     def test_high_damage(self):
         """Test with very high damage values."""
         strong_player = Character("Strong Player", 1000, 1000, "God Sword", 1000)
@@ -76,19 +126,87 @@ class TestCombat(unittest.TestCase):
         """Test boss bonus attack functionality."""
         original_health = self.player.get_health()
         bonus_triggered = False
+        # The most a normal attack can do (base damage plus weapon bonus) doesn't change
+        normal_damage = self.boss.get_damage() + 5
         
         # Try up to 100 times to trigger the 20% bonus attack
         for _ in range(100):
             self.boss.attack(self.player, self.logger)
-            if self.player.get_health() < original_health - self.boss.get_damage() - 5:  # More than normal attack
+            health = self.player.get_health()
+            if health < original_health - normal_damage:  # More than normal attack
                 bonus_triggered = True
                 break
-            original_health = self.player.get_health()
+            original_health = health
         
         self.assertTrue(bonus_triggered, "Boss bonus attack should trigger within 100 attempts")
 
+    def test_simulate_fight(self):
+        """Test the numbers-only fight simulation."""
+        # 15 damage a round kills a 50 health enemy in the 4th round, before it can win
+        self.assertEqual(simulate_fight(100, 15, 50, 10), (4, True))
+        # 2 damage a round can't beat 20 damage a round from an equal enemy
+        self.assertEqual(simulate_fight(100, 2, 100, 18, enemy_special=2), (5, False))
+        # When both need the same number of rounds, the player wins by striking first
+        self.assertEqual(simulate_fight(30, 10, 30, 10), (3, True))
+        # Fights nobody can win stop at the round limit
+        self.assertEqual(simulate_fight(100, 0, 100, 0, max_rounds=50), (50, False))
+
+    def test_simulate_batch(self):
+        """Test simulating many fights at once."""
+        player_stats = self.player.get_combat_stats()
+        self.assertEqual(player_stats, (100, 15, 0.1, 1.5, 0.0, 0))
+        # Bosses also report their 20% bonus attack of half their base damage
+        self.assertEqual(self.boss.get_combat_stats(), (200, 20, 0.25, 2.0, 0.2, 7))
+        # Without critical hits every fight plays out the same way
+        self.assertEqual(simulate_batch(20, (100, 15, 0.0, 1.0, 0.0, 0), (50, 10, 0.0, 1.0, 0.0, 0)), 20)
+        self.assertEqual(simulate_batch(20, (100, 2, 0.0, 1.0, 0.0, 0), (100, 20, 0.0, 1.0, 0.0, 0)), 0)
+        # The player wins the race to 5 hits, unless the enemy's bonus lands every time
+        self.assertEqual(simulate_batch(20, (100, 15, 0.0, 1.0, 0.0, 0), (75, 20, 0.0, 1.0, 0.0, 10)), 20)
+        self.assertEqual(simulate_batch(20, (100, 15, 0.0, 1.0, 0.0, 0), (75, 20, 0.0, 1.0, 1.0, 10)), 0)
+
+    def test_game_simulate_batch_needs_fights(self):
+        """Test that the game refuses to simulate zero fights."""
+        with self.assertRaises(ValueError):
+            Game().simulate_batch(0)
+
+    def use_item_menu(self, game, *answers):
+        """Answer the item menu with the given inputs; returns what handle_item_usage returned."""
+        with mock.patch('builtins.input', side_effect=answers), redirect_stdout(io.StringIO()):
+            return game.handle_item_usage(self.player)
+
+    def test_fast_item_usage_does_not_pause(self):
+        """Test that fast mode never waits for Enter in the item menu."""
+        game = Game(fast=True)
+        with mock.patch('rpg_game.game.press_enter', side_effect=AssertionError("paused")):
+            # An empty inventory, then using a potion
+            self.assertFalse(self.use_item_menu(game))
+            self.player.add_item(Potion("Health Potion", "Restores 30 health", 30))
+            self.assertTrue(self.use_item_menu(game, "1"))
+
+    def test_use_key_from_item_menu(self):
+        """Test that the boss reward key can be used from the item menu and is kept."""
+        game = Game(fast=True)
+        key = Key("Ancient Key", "A mysterious key that glows with magic", "Final Door")
+        self.player.add_item(key)
+        self.assertTrue(self.use_item_menu(game, "1"))
+        # Only potions are used up
+        self.assertEqual(self.player.get_inventory_items(), (key,))
+
+    def test_item_menu_back_uses_nothing(self):
+        """Test that picking the Back option leaves the inventory and health alone."""
+        game = Game(fast=True)
+        potion = Potion("Health Potion", "Restores 30 health", 30)
+        self.player.add_item(potion)
+        self.player.set_health(50)
+        health = self.player.get_health()
+        # One item, so Back is option 2
+        self.assertFalse(self.use_item_menu(game, "2"))
+        self.assertEqual(self.player.get_inventory_items(), (potion,))
+        self.assertEqual(self.player.get_health(), health)
+
 if __name__ == "__main__":
-    unittest.main(argv=['first-arg-is-ignored'], exit=False)
+    # buffer=True holds back each test's output and only shows it if the test fails
+    unittest.main(argv=['first-arg-is-ignored'], exit=False, verbosity=0, buffer=True)
     
     # Additional manual testing
     print("\n=== Manual Stress Test ===")
@@ -96,29 +214,35 @@ if __name__ == "__main__":
     
     player = Character("Player", 1000, 10, "Sword", 5)
     boss = Boss("Final Boss", 2000, 20)
+    logger = GameLogger()
     
     round_count = 0
-    while player.get_health() > 0 and boss.get_health() > 0 and round_count < 1000:
+    # Health is read once after each attack and reused for the report and checks
+    player_health = player.get_health()
+    boss_health = boss.get_health()
+    while player_health > 0 and boss_health > 0 and round_count < 1000:
         round_count += 1
         print(f"\n--- Round {round_count} ---")
         
         # Player's turn
-        player_damage, player_crit = player.attack(boss, GameLogger())
+        player_damage, player_crit = player.attack(boss, logger)
+        boss_health = boss.get_health()
         print(f"Player hits for {player_damage} damage" + (" (CRITICAL!)" if player_crit else ""))
-        print(f"Boss health: {boss.get_health()}")
+        print(f"Boss health: {boss_health}")
         
-        if boss.get_health() <= 0:
+        if boss_health <= 0:
             print("Player wins!")
             break
             
         # Boss's turn
-        boss_damage, boss_crit = boss.attack(player, GameLogger())
+        boss_damage, boss_crit = boss.attack(player, logger)
+        player_health = player.get_health()
         print(f"Boss hits for {boss_damage} damage" + (" (CRITICAL!)" if boss_crit else ""))
-        print(f"Player health: {player.get_health()}")
+        print(f"Player health: {player_health}")
         
-        if player.get_health() <= 0:
+        if player_health <= 0:
             print("Boss wins!")
             break
     
     print(f"\nCombat ended after {round_count} rounds")
-    print(f"Final health - Player: {player.get_health()}, Boss: {boss.get_health()}")
+    print(f"Final health - Player: {player_health}, Boss: {boss_health}")
@@ -0,0 +1,154 @@
+"""
+Tests for the GameLogger in the rpg_oop_concepts package.
+"""
+import io
+import os
+import re
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from rpg_oop_concepts.character import Character
+from rpg_oop_concepts import game_logger
+from rpg_oop_concepts.game_logger import GameLogger, BUFFER_LIMIT
+
+LOG_LINE = re.compile(r"^\[\d\d:\d\d:\d\d\] COMBAT LOG: Hero attacked Goblin for \d+ damage$")
+
+class TestGameLogger(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.hero = Character("Hero", 100, 10)
+        self.goblin = Character("Goblin", 50, 5)
+
+    def test_unbuffered_writes_at_once(self):
+        """Test that an unbuffered logger writes each message straight away."""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            GameLogger().log_combat(self.hero, self.goblin, 10)
+        self.assertRegex(out.getvalue().strip(), LOG_LINE)
+
+    def test_buffered_waits_for_flush(self):
+        """Test that buffered messages below BUFFER_LIMIT are only written by flush()."""
+        out = io.StringIO()
+        logger = GameLogger(buffered=True)
+        with redirect_stdout(out):
+            for damage in range(3):
+                logger.log_combat(self.hero, self.goblin, damage)
+            self.assertEqual(out.getvalue(), "")
+            logger.flush()
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        for damage, line in enumerate(lines):
+            self.assertRegex(line, LOG_LINE)
+            self.assertTrue(line.endswith(f"for {damage} damage"))
+
+    def test_buffered_writes_at_limit(self):
+        """Test that the buffer is written once it reaches BUFFER_LIMIT."""
+        out = io.StringIO()
+        logger = GameLogger(buffered=True)
+        with redirect_stdout(out):
+            while not out.getvalue():
+                logger.log_combat(self.hero, self.goblin, 1)
+            self.assertGreaterEqual(len(out.getvalue()), BUFFER_LIMIT)
+            self.assertEqual(logger._buf, [])
+
+    def test_no_console_logs_nothing(self):
+        """Test that nothing is written or buffered when console logging is off."""
+        out = io.StringIO()
+        logger = GameLogger(log_to_console=False, buffered=True)
+        with redirect_stdout(out):
+            logger.log_combat(self.hero, self.goblin, 10)
+            logger.flush()
+        self.assertEqual(out.getvalue(), "")
+
+    def test_flush_without_file_descriptor(self):
+        """Test that flush() falls back to one write when stdout has no file descriptor."""
+        out = io.StringIO()
+        logger = GameLogger(buffered=True)
+        with redirect_stdout(out):
+            logger.log_combat(self.hero, self.goblin, 1)
+            logger.log_combat(self.hero, self.goblin, 2)
+            with mock.patch.object(out, "write", wraps=out.write) as write:
+                logger.flush()
+        write.assert_called_once()
+        self.assertEqual(len(out.getvalue().splitlines()), 2)
+
+    def test_log_combat_batch(self):
+        """Test that a batch of events is written with one shared timestamp."""
+        events = [("Hero", "Goblin", 10), ("Hero", "Goblin", 12)]
+        out = io.StringIO()
+        with redirect_stdout(out):
+            GameLogger().log_combat_batch(events)
+        self.check_batch_lines(out.getvalue())
+
+    def test_log_combat_batch_buffered(self):
+        """Test that a buffered batch waits for flush() and keeps the same format."""
+        events = [("Hero", "Goblin", 10), ("Hero", "Goblin", 12)]
+        out = io.StringIO()
+        logger = GameLogger(buffered=True)
+        with redirect_stdout(out):
+            logger.log_combat_batch(events)
+            self.assertEqual(out.getvalue(), "")
+            logger.flush()
+        self.check_batch_lines(out.getvalue())
+
+    def check_batch_lines(self, output):
+        """Check the lines written for the two events in the batch tests."""
+        lines = output.splitlines()
+        self.assertEqual(len(lines), 2)
+        for line in lines:
+            self.assertRegex(line, LOG_LINE)
+        self.assertTrue(lines[0].endswith("for 10 damage"))
+        self.assertTrue(lines[1].endswith("for 12 damage"))
+        # Everything before the names, including the time, is the same on every line
+        self.assertEqual(lines[0][:lines[0].index("Hero")], lines[1][:lines[1].index("Hero")])
+
+
+@unittest.skipUnless(hasattr(os, "writev"), "os.writev is not available on this system")
+class TestWritev(unittest.TestCase):
+    def setUp(self):
+        """Set up a pipe to stand in for stdout."""
+        read_fd, write_fd = os.pipe()
+        self.reader = open(read_fd, "r", encoding="utf-8")
+        self.writer = open(write_fd, "w", encoding="utf-8")
+        self.hero = Character("Hero", 100, 10)
+        self.goblin = Character("Goblin", 50, 5)
+
+    def tearDown(self):
+        """Close both ends of the pipe."""
+        self.writer.close()
+        self.reader.close()
+
+    def read_all(self):
+        """Close the writing end and return everything written to the pipe."""
+        self.writer.close()
+        return self.reader.read()
+
+    def test_flush_to_pipe(self):
+        """Test that flush() writes to a real file descriptor, after stdout's own output."""
+        logger = GameLogger(buffered=True)
+        with redirect_stdout(self.writer):
+            # Still waiting in stdout's own buffer when the logger flushes
+            print("before")
+            logger.log_combat(self.hero, self.goblin, 1)
+            logger.log_combat(self.hero, self.goblin, 2)
+            with mock.patch.object(game_logger.os, "writev", wraps=os.writev) as writev:
+                logger.flush()
+        writev.assert_called_once()
+        lines = self.read_all().splitlines()
+        self.assertEqual(lines[0], "before")
+        self.assertEqual(len(lines), 3)
+        for line in lines[1:]:
+            self.assertRegex(line, LOG_LINE)
+
+    def test_short_write_is_finished(self):
+        """Test that bytes left over by a short os.writev are still written."""
+        pieces = [b"first\n", b"second\n"]
+        # Pretend the system only accepted the first 3 bytes
+        with mock.patch.object(game_logger.os, "writev", return_value=3):
+            game_logger._writev_all(self.writer.fileno(), pieces)
+        # Only what os.write sent is in the pipe, starting where writev stopped
+        self.assertEqual(self.read_all(), "st\nsecond\n")
+
+if __name__ == "__main__":
+    unittest.main()
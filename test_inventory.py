@@ -1,11 +1,21 @@
 """Test script for the inventory system."""
+import sys
+import unittest
 
 from rpg_game.character import Character
-from rpg_game.inventory import Potion, Key, Item
+from rpg_game.inventory import Inventory, Potion, Key, Item
 
 def test_inventory_system():
     """Test the inventory system functionality."""
-    print("=== Testing Inventory System ===\n")
+    # Lines are collected here and written together, just before anything that
+    # prints for itself (like display_inventory) and at the end
+    out = ["=== Testing Inventory System ===\n"]
+    
+    def flush_out():
+        """Write the collected lines in one go."""
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
+            out.clear()
     
     # Create a character
     player = Character("TestHero", 100, 10, "Sword", 5)
@@ -15,45 +25,104 @@ def test_inventory_system():
     mana_potion = Potion("Mana Potion", "Restores 20 mana", 20)
     key = Key("Rusty Key", "An old rusty key", "Dungeon Door")
     
-    print("Adding items to inventory...")
+    out.append("Adding items to inventory...")
     player.add_item(health_potion)
     player.add_item(mana_potion)
     player.add_item(key)
     
     # Test displaying inventory
-    print("\nInventory after adding items:")
+    out.append("\nInventory after adding items:")
+    flush_out()
     player.display_inventory()
     
     # Test using an item
-    print("\nUsing Health Potion...")
-    print(player.use_item("Health Potion"))
-    print(f"Player health after potion: {player.get_health()}")
+    out.append("\nUsing Health Potion...")
+    out.append(player.use_item("Health Potion"))
+    out.append(f"Player health after potion: {player.get_health()}")
     
     # Test inventory after using an item
-    print("\nInventory after using Health Potion:")
+    out.append("\nInventory after using Health Potion:")
+    flush_out()
     player.display_inventory()
     
     # Test adding gold
-    print("\nAdding 100 gold...")
+    out.append("\nAdding 100 gold...")
     player.add_gold(100)
+    flush_out()
     player.display_inventory()
     
     # Test removing gold
-    print("\nRemoving 30 gold...")
+    out.append("\nRemoving 30 gold...")
     if player.remove_gold(30):
-        print("Successfully removed 30 gold")
+        out.append("Successfully removed 30 gold")
     else:
-        print("Failed to remove gold")
+        out.append("Failed to remove gold")
+    flush_out()
     player.display_inventory()
     
     # Test trying to remove more gold than available
-    print("\nTrying to remove 100 gold (only 70 available)...")
+    out.append("\nTrying to remove 100 gold (only 70 available)...")
     if player.remove_gold(100):
-        print("Successfully removed 100 gold")
+        out.append("Successfully removed 100 gold")
     else:
-        print("Failed to remove gold (as expected)")
+        out.append("Failed to remove gold (as expected)")
     
-    print("\n=== Inventory System Test Complete ===")
+    out.append("\n=== Inventory System Test Complete ===")
+    flush_out()
+
+class TestInventory(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.inventory = Inventory()
+        self.potion = Potion("Health Potion", "Restores 30 health", 30)
+        self.key = Key("Rusty Key", "An old rusty key", "Dungeon Door")
+
+    def test_remove_item_ignores_case(self):
+        """Test removing an item by a name with different case."""
+        self.inventory.add_item(self.potion)
+        self.assertIs(self.inventory.remove_item("HEALTH potion"), self.potion)
+        self.assertEqual(self.inventory.items, [])
+        self.assertIsNone(self.inventory.get_item("Health Potion"))
+
+    def test_remove_duplicates_in_order(self):
+        """Test that items with the same name are removed in the order they were added."""
+        second_potion = Potion("Health Potion", "Restores 30 health", 30)
+        self.inventory.add_item(self.potion)
+        self.inventory.add_item(self.key)
+        self.inventory.add_item(second_potion)
+        self.assertIs(self.inventory.remove_item("Health Potion"), self.potion)
+        self.assertIs(self.inventory.get_item("Health Potion"), second_potion)
+        self.assertIs(self.inventory.remove_item("Health Potion"), second_potion)
+        self.assertEqual(self.inventory.items, [self.key])
+
+    def test_remove_missing_item(self):
+        """Test that removing a name that isn't there returns None and changes nothing."""
+        self.inventory.add_item(self.key)
+        self.assertIsNone(self.inventory.remove_item("Health Potion"))
+        self.assertEqual(self.inventory.items, [self.key])
+
+    def test_has_potion(self):
+        """Test that has_potion follows potions being added and removed."""
+        second_potion = Potion("Health Potion", "Restores 30 health", 30)
+        self.assertFalse(self.inventory.has_potion())
+        self.inventory.add_item(self.potion)
+        self.inventory.add_item(self.key)
+        self.inventory.add_item(second_potion)
+        self.assertTrue(self.inventory.has_potion())
+        self.inventory.remove_item("Health Potion")
+        self.assertTrue(self.inventory.has_potion())
+        # Removing the last potion leaves only the key's type code behind
+        self.inventory.remove_item("Health Potion")
+        self.assertFalse(self.inventory.has_potion())
+        self.assertEqual(self.inventory.items, [self.key])
+
+    def test_has_potion_subclass(self):
+        """Test that a subclass of Potion still counts as a potion."""
+        class BigPotion(Potion):
+            pass
+
+        self.inventory.add_item(BigPotion("Big Potion", "Restores 60 health", 60))
+        self.assertTrue(self.inventory.has_potion())
 
 if __name__ == "__main__":
     test_inventory_system()
@@ -0,0 +1,36 @@
+"""
+Tests for the Weapon class in the rpg_oop_concepts package.
+"""
+import copy
+import pickle
+import unittest
+
+from rpg_oop_concepts.character import Character
+from rpg_oop_concepts.weapon import Weapon
+
+class TestWeapon(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.weapon = Weapon("Rock", 2)
+        # Fill the __str__ cache so the copies below start from a used weapon
+        str(self.weapon)
+
+    def test_copy_and_pickle(self):
+        """Test that weapons survive copying and pickling unchanged."""
+        for clone in (
+            copy.copy(self.weapon),
+            copy.deepcopy(self.weapon),
+            pickle.loads(pickle.dumps(self.weapon)),
+        ):
+            self.assertEqual(clone, self.weapon)
+            self.assertEqual(str(clone), "Rock (+2 Damage)")
+
+    def test_deepcopy_character(self):
+        """Test that a character holding a weapon can be deep copied."""
+        hero = Character("Hero", 100, 10, "Rock", 2)
+        clone = copy.deepcopy(hero)
+        self.assertEqual(clone.weapon, hero.weapon)
+        self.assertEqual(clone.calculate_damage(), 12)
+
+if __name__ == "__main__":
+    unittest.main()